@@ -2,7 +2,6 @@
 import json
 import os
 from typing import Dict, Any
-import openai
 
 from .models import ContentDNA
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
 
@@ -10,40 +10,44 @@ class PostStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# ContentDNA fields holding lists of strings; stored as tuples
+_DNA_SEQUENCE_FIELDS = (
+    "technical_details", "key_metrics", "unique_aspects", "limitations",
+    "best_fit_communities", "visual_opportunities", "platform_constraints",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ContentDNA:
     """Core content analysis extracted from original post"""
     value_proposition: str
-    technical_details: List[str]
+    technical_details: Tuple[str, ...]
     problem_solved: str
     target_audience: str
-    key_metrics: List[str]
-    unique_aspects: List[str]
-    limitations: List[str]
+    key_metrics: Tuple[str, ...]
+    unique_aspects: Tuple[str, ...]
+    limitations: Tuple[str, ...]
     content_type: str  # "tool_launch", "tutorial", "opinion", "case_study", "announcement"
     # Distribution-relevant fields
     controversy_potential: str = "low"  # low/medium/high - sparks debate?
     novelty_score: str = "incremental"  # incremental/notable/breakthrough
     show_dont_tell: str = "none"  # none/some/strong - demos, screenshots, metrics?
-    best_fit_communities: List[str] = None  # specific subreddits/communities that would care
+    best_fit_communities: Tuple[str, ...] = ()  # specific subreddits/communities that would care
     # Visual opportunities
-    visual_opportunities: List[str] = None  # "ASCII architecture diagram", "terminal output demo", etc.
+    visual_opportunities: Tuple[str, ...] = ()  # "ASCII architecture diagram", "terminal output demo", etc.
     # Platform constraints
-    platform_constraints: List[str] = None  # "macOS only", "Linux 6.12+", "Apple Silicon required"
+    platform_constraints: Tuple[str, ...] = ()  # "macOS only", "Linux 6.12+", "Apple Silicon required"
     # User-provided context (filled by interview)
     project_stage: str = "unknown"  # experiment/mvp/beta/production
     founder_story: str = ""  # Why you built this, personal narrative
 
     def __post_init__(self):
-        if self.best_fit_communities is None:
-            self.best_fit_communities = []
-        if self.visual_opportunities is None:
-            self.visual_opportunities = []
-        if self.platform_constraints is None:
-            self.platform_constraints = []
+        # Accept lists (e.g. straight from LLM JSON) or None, store immutable tuples
+        for name in _DNA_SEQUENCE_FIELDS:
+            object.__setattr__(self, name, tuple(getattr(self, name) or ()))
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """User's professional identity for platform targeting"""
     professional_roles: List[str]  # ["SRE", "Backend Engineer", "Founder"]
@@ -57,7 +61,7 @@ class UserProfile:
             self.active_platforms = []
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of content validation"""
     is_valid: bool
@@ -65,8 +69,17 @@ class ValidationResult:
     errors: List[str]
     suggestions: List[str]
 
+    def has(self, kind: str, *texts: str) -> bool:
+        """Case-insensitive check that one 'errors'/'warnings'/'suggestions' message contains all texts"""
+        needles = [text.lower() for text in texts]
+        for message in getattr(self, kind):
+            lowered = message.lower()
+            if all(needle in lowered for needle in needles):
+                return True
+        return False
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlatformContent:
     """Generated content for a specific platform"""
     platform: str
@@ -77,7 +90,7 @@ class PlatformContent:
     scheduled_time: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PublishResult:
     """Result of posting to a platform"""
     platform: str
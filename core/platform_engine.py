@@ -1,18 +1,33 @@
 import yaml
 import json
 import os
+import re
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
-import openai
 
 from .models import ContentDNA, PlatformContent, ValidationResult
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# libyaml's C loader when PyYAML was built against it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 MAX_LLM_RESPONSE_SIZE = 256 * 1024  # 256KB limit for LLM responses
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1  # seconds
 
+# Tokens that matter when escaping raw control chars inside JSON strings
+_JSON_STRING_TOKEN_RE = re.compile(r'\\.|["\n\r\t]', re.DOTALL)
+_STRING_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+# '{' in the first column: where a JSON object starts after prose that has braces of its own
+_LINE_START_OBJECT_RE = re.compile(r'^\{', re.MULTILINE)
+
 class PlatformAdapter(ABC):
     """Base class for all platform-specific adapters"""
     
@@ -24,10 +39,11 @@ class PlatformAdapter(ABC):
     def _load_profile(self) -> Dict[str, Any]:
         """Load platform profile from yaml config (optional)"""
         profile_path = self.config_dir / "profile.yaml"
-        if not profile_path.exists():
+        try:
+            with open(profile_path, 'r') as f:
+                return yaml.load(f, Loader=_YAML_LOADER) or {}
+        except FileNotFoundError:
             return {}
-        with open(profile_path, 'r') as f:
-            return yaml.safe_load(f) or {}
             
     @abstractmethod
     def generate_content(self, content_dna: ContentDNA) -> PlatformContent:
@@ -41,8 +57,7 @@ class PlatformAdapter(ABC):
         
     def _make_llm_call(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
         """Execute LLM call with retry, backoff, and JSON parsing via LiteLLM"""
-        from litellm import completion
-        import re
+        from litellm import completion, APIConnectionError, RateLimitError, Timeout
 
         messages = []
         if system_prompt:
@@ -61,6 +76,10 @@ class PlatformAdapter(ABC):
                 )
 
                 content = response.choices[0].message.content
+                if content is None:
+                    # Content-filtered or tool-call reply; asking again gets the same answer
+                    print("Error in LLM call: response has no message content")
+                    return {}
 
                 # Validate response size
                 if len(content.encode('utf-8')) > MAX_LLM_RESPONSE_SIZE:
@@ -70,6 +89,13 @@ class PlatformAdapter(ABC):
                 return self._parse_json_response(content)
 
             except Exception as e:
+                # Dropped connections, timeouts, rate limits and any 5xx (incl. 502 and
+                # litellm's generic APIError) are worth retrying; auth, bad requests,
+                # other 4xx and plain bugs propagate to the caller
+                status = getattr(e, "status_code", None)
+                if not (isinstance(e, (APIConnectionError, RateLimitError, Timeout))
+                        or (isinstance(status, int) and status >= 500)):
+                    raise
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
                     backoff = INITIAL_BACKOFF * (2 ** attempt)
@@ -81,57 +107,53 @@ class PlatformAdapter(ABC):
 
     def _parse_json_response(self, content: str) -> Dict[str, Any]:
         """Parse JSON from LLM response with robust error handling"""
-        import re
-
-        # Try to extract JSON from markdown code blocks
-        # Use greedy match to handle nested code blocks in body content
-        json_match = re.search(r'^```(?:json)?\s*\n([\s\S]*)\n```\s*$', content.strip())
-        if json_match:
-            content = json_match.group(1).strip()
-        else:
-            # Try finding JSON object directly (starts with { ends with })
-            brace_match = re.search(r'(\{[\s\S]*\})\s*$', content)
-            if brace_match:
-                content = brace_match.group(1)
-
-        # Try direct parsing first
+        # Well-behaved responses are bare JSON; skip the slicing for them
         try:
-            return json.loads(content)
+            return json_loads(content)
         except json.JSONDecodeError:
             pass
 
         # Fix common JSON issues: unescaped newlines in string values
         # Replace actual newlines inside strings with \n
         def fix_string_newlines(s: str) -> str:
-            result = []
             in_string = False
-            escape_next = False
-            for char in s:
-                if escape_next:
-                    result.append(char)
-                    escape_next = False
-                elif char == '\\':
-                    result.append(char)
-                    escape_next = True
-                elif char == '"':
-                    result.append(char)
-                    in_string = not in_string
-                elif char == '\n' and in_string:
-                    result.append('\\n')
-                elif char == '\r' and in_string:
-                    result.append('\\r')
-                elif char == '\t' and in_string:
-                    result.append('\\t')
-                else:
-                    result.append(char)
-            return ''.join(result)
 
-        try:
-            fixed = fix_string_newlines(content)
-            return json.loads(fixed)
-        except json.JSONDecodeError as e:
-            print(f"Error in LLM call: {e}")
+            # Visit only quotes, escape pairs and control chars; everything else is copied by re
+            def replace(match):
+                nonlocal in_string
+                token = match.group()
+                if token == '"':
+                    in_string = not in_string
+                elif in_string and token in _STRING_CONTROL_ESCAPES:
+                    return _STRING_CONTROL_ESCAPES[token]
+                return token
+
+            return _JSON_STRING_TOKEN_RE.sub(replace, s)
+
+        # The object ends at the last '}', which drops markdown fences and trailing
+        # prose. It usually starts at the first '{', but a brace in prose before it
+        # ("use {} placeholders") starts too early, so an object opening a later line
+        # is tried next
+        start = content.find('{')
+        end = content.rfind('}')
+        if start == -1 or end < start:
+            print("Error in LLM call: no JSON object in response")
             return {}
+        starts = [start] + [m.start() for m in _LINE_START_OBJECT_RE.finditer(content, start + 1, end)]
+
+        error = None
+        for start in starts:
+            candidate = content[start:end + 1]
+            try:
+                return json_loads(candidate)
+            except json.JSONDecodeError:
+                pass
+            try:
+                return json_loads(fix_string_newlines(candidate))
+            except json.JSONDecodeError as e:
+                error = e
+        print(f"Error in LLM call: {error}")
+        return {}
 
 class Validator(ABC):
     """Base class for content validators"""
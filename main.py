@@ -3,9 +3,13 @@ import os
 import argparse
 import sys
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import replace
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, Type
+from typing import Dict, List, Optional, Type
 
 from core.content_analyzer import ContentAnalyzer
 from core.platform_engine import PlatformAdapter
@@ -89,31 +93,32 @@ def load_content(file_path: str) -> str:
 
 PLATFORM_NAME_PATTERN = re.compile(r'^[a-z0-9_]+$')
 MAX_ARTIFACT_SIZE = 512 * 1024  # 512KB limit for artifacts
+ARTIFACTS_DIR = Path("artifacts")
+MAX_PARALLEL_GENERATIONS = 4  # concurrent LLM generations; keeps under provider rate limits
 
 def validate_platform_name(platform: str) -> bool:
     """Validate platform name to prevent path traversal"""
     return bool(PLATFORM_NAME_PATTERN.match(platform))
 
-def save_artifact(platform: str, content: str, metadata: Dict = None):
-    """Save generated content to artifacts directory"""
+def save_artifact(platform: str, content: str, metadata: Dict = None, out_dir: Path = ARTIFACTS_DIR):
+    """Save generated content to artifacts directory (main() creates it up front)"""
     if not validate_platform_name(platform):
         print(f"   ❌ Invalid platform name: {platform}")
         return
 
-    if len(content.encode('utf-8')) > MAX_ARTIFACT_SIZE:
+    # Encode once: the same bytes are size-checked and written
+    data = content.encode('utf-8')
+    if len(data) > MAX_ARTIFACT_SIZE:
         print(f"   ❌ Content too large. Max: {MAX_ARTIFACT_SIZE} bytes")
         return
 
-    output_dir = Path("artifacts")
-    output_dir.mkdir(exist_ok=True)
+    if not out_dir.is_dir():
+        out_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = f"{platform}_post.md"
-    file_path = output_dir / filename
+    file_path = out_dir / f"{platform}_post.md"
+    file_path.write_bytes(data)
 
-    with open(file_path, 'w') as f:
-        f.write(content)
-
-    print(f"   📄 Saved to artifacts/{filename}")
+    print(f"   📄 Saved to {file_path}")
 
 def print_validation_report(validation):
     """Print validation results prettily"""
@@ -145,6 +150,115 @@ def load_config() -> Dict:
     with open(config_path, "rb") as f:
         return toml.load(f)
 
+class GenerationOutput:
+    """sys.stdout stand-in that holds back what generation threads print
+
+    A worker writes into the list passed to capture(), so retry and parse
+    messages can be replayed under their own platform's header; writes from
+    any other thread go straight to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self, chunks: Optional[List[str]]):
+        """Send this thread's writes to chunks, or back to the stream for None"""
+        self._local.chunks = chunks
+
+    def write(self, text: str) -> int:
+        chunks = getattr(self._local, "chunks", None)
+        if chunks is None:
+            return self.stream.write(text)
+        chunks.append(text)
+        return len(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def report_platform(platform_name, generation, held_output, dna, model, timing_advisor):
+    """Validate, save and report one platform's generated content"""
+    print(f"\n🔸 Processing: {platform_name.upper()}")
+
+    try:
+        # Wait for generation, then replay what it printed on its worker thread
+        print(f"   Thinking...")
+        try:
+            adapter, content = generation.result()
+        finally:
+            sys.stdout.write("".join(held_output))
+
+        # Get timing info
+        timing = timing_advisor.get_suggestion(platform_name)
+
+        # Validate
+        print(f"   Validating...")
+        validation = adapter.validate_content(content)
+
+        # Build timing section
+        timing_status = "✅ Good time now!" if timing.current_is_good else f"⏰ Best: {timing.next_good_window}"
+        timing_section = f"""## ⏰ When to Post
+- Best days: {', '.join(timing.best_days)}
+- Best hours (UTC): {', '.join(f'{h}:00' for h in timing.best_hours_utc)}
+- Avoid: {', '.join(timing.avoid)}
+- Status: {timing_status}
+- 💡 {timing.notes}
+"""
+
+        # Build visual opportunities section
+        visual_section = ""
+        if dna.visual_opportunities:
+            visual_section = "## 📸 Visual Assets to Include\n"
+            for viz in dna.visual_opportunities:
+                visual_section += f"- [ ] {viz}\n"
+            visual_section += "\n"
+
+        # Build constraints section
+        constraints_section = ""
+        if dna.platform_constraints:
+            constraints_section = "## ⚠️ Mention These Constraints\n"
+            for constraint in dna.platform_constraints:
+                constraints_section += f"- {constraint}\n"
+            constraints_section += "\n"
+
+        # Save Artifact with all context
+        final_output = f"""---
+platform: {platform_name}
+title: {content.title}
+status: {'generated' if validation.is_valid else 'needs_review'}
+model: {model}
+project_stage: {dna.project_stage}
+---
+
+# {content.title}
+
+{content.body}
+
+---
+{visual_section}{constraints_section}{timing_section}
+---
+## 🧠 Generation Metadata
+- Project Stage: {dna.project_stage}
+- Strategy: {content.metadata.get('engagement_strategy', 'Standard')}
+- Tags: {', '.join(content.metadata.get('tags', []))}
+- Reality Check: {content.metadata.get('reality_check', 'N/A')}
+"""
+        save_artifact(platform_name, final_output, content.metadata)
+        
+        # Report
+        if validation.is_valid:
+            print(f"   ✅ Success! Ready to publish.")
+        else:
+            print(f"   ⚠️  Generated with issues.")
+        
+        print_validation_report(validation)
+        
+    except Exception as e:
+        print(f"   ❌ Failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
 def main():
     setup_environment()
     config = load_config()
@@ -227,16 +341,16 @@ def main():
     # Run story interview or quick stage prompt
     if args.interview:
         story_context = run_interview(skip_profile=True)
-        dna.project_stage = story_context.project_stage
-        dna.founder_story = story_context.founder_story
+        dna = replace(dna, project_stage=story_context.project_stage,
+                      founder_story=story_context.founder_story)
     else:
         # Quick stage prompt
-        dna.project_stage = quick_stage_prompt()
+        dna = replace(dna, project_stage=quick_stage_prompt())
 
     # 2. Determine target platforms
     if args.platforms:
-        # User explicitly specified platforms - use those
-        target_platforms = args.platforms
+        # User explicitly specified platforms - use those, each once and in order
+        target_platforms = list(dict.fromkeys(args.platforms))
         print(f"\n📋 Using specified platforms: {', '.join(target_platforms)}")
         recommendations = None
     elif args.all:
@@ -295,93 +409,37 @@ def main():
     from core.timing_advisor import TimingAdvisor
     timing_advisor = TimingAdvisor()
 
+    ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+
     # 3. Generate for Platforms
     print(f"\n🏭 Generating Content for {len(target_platforms)} Platforms...")
 
-    for platform_name in target_platforms:
-        print(f"\n🔸 Processing: {platform_name.upper()}")
+    output = GenerationOutput(sys.stdout)
+    held_output = {name: [] for name in target_platforms}
 
+    def generate(platform_name):
+        output.capture(held_output[platform_name])
         try:
             # Initialize Adapter with model override
             adapter_class = ADAPTER_REGISTRY[platform_name]
             config_dir = Path(f"platforms/{platform_name}")
             adapter = adapter_class(config_dir, model=args.model)
-
-            # Get timing info
-            timing = timing_advisor.get_suggestion(platform_name)
-
-            # Generate
-            print(f"   Thinking...")
-            content = adapter.generate_content(dna)
-
-            # Validate
-            print(f"   Validating...")
-            validation = adapter.validate_content(content)
-
-            # Build timing section
-            timing_status = "✅ Good time now!" if timing.current_is_good else f"⏰ Best: {timing.next_good_window}"
-            timing_section = f"""## ⏰ When to Post
-- Best days: {', '.join(timing.best_days)}
-- Best hours (UTC): {', '.join(f'{h}:00' for h in timing.best_hours_utc)}
-- Avoid: {', '.join(timing.avoid)}
-- Status: {timing_status}
-- 💡 {timing.notes}
-"""
-
-            # Build visual opportunities section
-            visual_section = ""
-            if dna.visual_opportunities:
-                visual_section = "## 📸 Visual Assets to Include\n"
-                for viz in dna.visual_opportunities:
-                    visual_section += f"- [ ] {viz}\n"
-                visual_section += "\n"
-
-            # Build constraints section
-            constraints_section = ""
-            if dna.platform_constraints:
-                constraints_section = "## ⚠️ Mention These Constraints\n"
-                for constraint in dna.platform_constraints:
-                    constraints_section += f"- {constraint}\n"
-                constraints_section += "\n"
-
-            # Save Artifact with all context
-            final_output = f"""---
-platform: {platform_name}
-title: {content.title}
-status: {'generated' if validation.is_valid else 'needs_review'}
-model: {args.model}
-project_stage: {dna.project_stage}
----
-
-# {content.title}
-
-{content.body}
-
----
-{visual_section}{constraints_section}{timing_section}
----
-## 🧠 Generation Metadata
-- Project Stage: {dna.project_stage}
-- Strategy: {content.metadata.get('engagement_strategy', 'Standard')}
-- Tags: {', '.join(content.metadata.get('tags', []))}
-- Reality Check: {content.metadata.get('reality_check', 'N/A')}
-"""
-            save_artifact(platform_name, final_output, content.metadata)
-            
-            # Report
-            if validation.is_valid:
-                print(f"   ✅ Success! Ready to publish.")
-            else:
-                print(f"   ⚠️  Generated with issues.")
-            
-            print_validation_report(validation)
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
-            import traceback
-            traceback.print_exc()
+            return adapter, adapter.generate_content(dna)
+        finally:
+            output.capture(None)
+
+    # LLM calls dominate and are independent per platform: start them all,
+    # then report in the requested order as each one finishes
+    with redirect_stdout(output), ThreadPoolExecutor(max_workers=MAX_PARALLEL_GENERATIONS) as pool:
+        generations = {name: pool.submit(generate, name) for name in target_platforms}
+        for platform_name in target_platforms:
+            report_platform(
+                platform_name, generations[platform_name], held_output[platform_name],
+                dna, args.model, timing_advisor
+            )
 
     print("\n✨ Done! Check the 'artifacts/' directory for your content.\n")
 
+
 if __name__ == "__main__":
     main()
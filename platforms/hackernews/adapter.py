@@ -10,7 +10,7 @@ class HackernewsAdapter(PlatformAdapter):
     
     def __init__(self, config_dir: Path, model: str = None):
         super().__init__(config_dir, model)
-        self.validator = HackerNewsValidator(self.profile)
+        self.validator = HackerNewsValidator()
     
     def generate_content(self, content_dna: ContentDNA) -> PlatformContent:
         """Generate HN-specific content following community guidelines"""
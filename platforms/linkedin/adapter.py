@@ -4,6 +4,9 @@ from typing import Dict, Any
 from core.platform_engine import PlatformAdapter
 from core.models import ContentDNA, PlatformContent, ValidationResult
 
+# Stored lowercase so validation can match against a single lowered body
+_OVERUSED_PHRASES = ('excited to announce', 'thrilled to share', 'proud to announce', 'delighted to')
+
 
 class LinkedinAdapter(PlatformAdapter):
     """LinkedIn platform adapter optimized for professional reach"""
@@ -152,15 +155,15 @@ Return JSON:
             errors.append("External link in post body kills reach - move to first comment")
 
         # Check for overused phrases
-        overused = ['excited to announce', 'thrilled to share', 'proud to announce', 'delighted to']
-        for phrase in overused:
-            if phrase.lower() in body.lower():
+        body_lower = body.lower()
+        for phrase in _OVERUSED_PHRASES:
+            if phrase in body_lower:
                 warnings.append(f"Overused phrase detected: '{phrase}' - algorithm may deprioritize")
                 break
 
         # Check for line breaks (mobile readability)
-        paragraphs = body.split('\n\n')
-        if len(paragraphs) < 3:
+        paragraph_count = body.count('\n\n') + 1
+        if paragraph_count < 3:
             suggestions.append("Add more line breaks between paragraphs for mobile readability")
 
         # Check for engagement hook
@@ -168,8 +171,8 @@ Return JSON:
             suggestions.append("Consider ending with a question to drive comments")
 
         # Check hashtag placement
-        lines = body.strip().split('\n')
-        if lines and '#' in lines[0]:
+        first_line = body.lstrip().partition('\n')[0]
+        if '#' in first_line:
             warnings.append("Hashtags should be at the end, not the beginning")
 
         is_valid = len(errors) == 0
@@ -5,6 +5,8 @@ from pathlib import Path
 from core.platform_engine import PlatformAdapter
 from core.models import ContentDNA, PlatformContent, ValidationResult
 
+_PERSONAL_INDICATORS = ('i ', 'my ', 'we ', 'our ', 'when i', 'i\'ve', 'i\'m')
+
 
 class MediumAdapter(PlatformAdapter):
     """Medium platform adapter with SEO optimization"""
@@ -162,7 +164,7 @@ Return JSON:
             warnings.append("Article might be too short for Medium (recommend >1000 words)")
         
         # Check for headers
-        if not any(line.startswith('#') for line in body.split('\n')):
+        if not (body.startswith('#') or '\n#' in body):
             suggestions.append("Consider adding section headers for better readability")
         
         # Validate tags
@@ -173,8 +175,8 @@ Return JSON:
             warnings.append("Consider adding tags for better discoverability")
         
         # Check for personal elements
-        personal_indicators = ['i ', 'my ', 'we ', 'our ', 'when i', 'i\'ve', 'i\'m']
-        if not any(indicator in body.lower() for indicator in personal_indicators):
+        body_lower = body.lower()
+        if not any(indicator in body_lower for indicator in _PERSONAL_INDICATORS):
             suggestions.append("Consider adding personal insights or experiences")
         
         is_valid = len(errors) == 0
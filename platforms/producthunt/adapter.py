@@ -160,30 +160,33 @@ Return JSON:
 
         # Validate tagline
         tagline = meta.get('tagline', '')
+        tagline_len = len(tagline)
         if not tagline:
             errors.append("Tagline is required")
-        elif len(tagline) > 80:
-            errors.append(f"Tagline too long: {len(tagline)}/80 chars")
-        elif len(tagline) < 20:
+        elif tagline_len > 80:
+            errors.append(f"Tagline too long: {tagline_len}/80 chars")
+        elif tagline_len < 20:
             warnings.append("Tagline may be too short to convey value")
 
         # Validate description
-        description = meta.get('description', '')
-        if len(description) > 260:
-            errors.append(f"Description too long: {len(description)}/260 chars")
+        description_len = len(meta.get('description', ''))
+        if description_len > 260:
+            errors.append(f"Description too long: {description_len}/260 chars")
 
         # Validate first comment
         first_comment = meta.get('first_comment', '')
         if not first_comment:
             errors.append("First comment (maker story) is required")
-        elif len(first_comment) < 200:
-            warnings.append("First comment may be too short - tell your story")
-        elif len(first_comment) > 1000:
-            warnings.append("First comment is quite long - consider condensing")
-
-        # Check for question in first comment
-        if first_comment and '?' not in first_comment:
-            suggestions.append("Consider adding a question in first comment to drive engagement")
+        else:
+            comment_len = len(first_comment)
+            if comment_len < 200:
+                warnings.append("First comment may be too short - tell your story")
+            elif comment_len > 1000:
+                warnings.append("First comment is quite long - consider condensing")
+
+            # Check for question in first comment
+            if '?' not in first_comment:
+                suggestions.append("Consider adding a question in first comment to drive engagement")
 
         # Validate topics
         topics = meta.get('topics', [])
@@ -1,9 +1,16 @@
+import re
 from pathlib import Path
 from typing import Dict, Any, List
 
 from core.platform_engine import PlatformAdapter
 from core.models import ContentDNA, PlatformContent, ValidationResult
 
+# Title phrases that read as self-promotion; the first one found is reported
+_PROMO_FLAGS = ('check out', 'i made', 'i built', 'my new', 'announcing', 'launching')
+# Pictographs through the symbols-and-pictographs extensions (Reddit culture dislikes them),
+# plus the emoji-styled dingbats LLMs reach for; plain marks like ✓ ✔ ★ → stay allowed
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001FAFF\u2705\u2728\u274C\u2764\u26A1\u2B50]')
+
 
 class RedditAdapter(PlatformAdapter):
     """Reddit platform adapter with subreddit-aware content generation"""
@@ -191,9 +198,9 @@ Return JSON:
                 errors.append(f"r/{subreddit}: Title too long ({len(title)}/300)")
 
             # Check for self-promo red flags
-            promo_flags = ['check out', 'i made', 'i built', 'my new', 'announcing', 'launching']
-            for flag in promo_flags:
-                if flag in title.lower():
+            title_lower = title.lower()
+            for flag in _PROMO_FLAGS:
+                if flag in title_lower:
                     warnings.append(f"r/{subreddit}: Title may sound self-promotional ('{flag}')")
                     break
 
@@ -204,13 +211,11 @@ Return JSON:
                 warnings.append(f"r/{subreddit}: Body very long - consider condensing")
 
             # Check for emoji (Reddit culture dislikes them)
-            import re
-            emoji_pattern = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF]')
-            if emoji_pattern.search(body) or emoji_pattern.search(title):
+            if _EMOJI_RE.search(body) or _EMOJI_RE.search(title):
                 warnings.append(f"r/{subreddit}: Contains emoji - not typical for Reddit")
 
             # Check for link placement
-            if body.strip().startswith('http'):
+            if body.lstrip().startswith(('http://', 'https://')):
                 warnings.append(f"r/{subreddit}: Body starts with link - put context first")
 
         is_valid = len(errors) == 0
@@ -3,6 +3,9 @@ from pathlib import Path
 from typing import List, Dict, Any
 from core.models import ContentDNA
 
+# libyaml's C loader when PyYAML was built against it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SubredditAnalyzer:
     """Analyzes and selects optimal subreddits for content"""
@@ -14,7 +17,7 @@ class SubredditAnalyzer:
     def _load_subreddit_data(self) -> Dict[str, Any]:
         """Load subreddit rules and culture data"""
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
     
     def select_subreddits(self, content_dna: ContentDNA, max_count: int = 3) -> List[Dict[str, Any]]:
         """Select best subreddits based on content DNA"""
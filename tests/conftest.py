@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, patch
 from core.models import ContentDNA, ValidationResult, PlatformContent, PublishResult, PostStatus
 
 
-@pytest.fixture
+# Model fixtures are built once per session; tests treat them as read-only
+@pytest.fixture(scope="session")
 def sample_content_dna():
     """Create a sample ContentDNA for testing."""
     return ContentDNA(
@@ -20,7 +21,7 @@ def sample_content_dna():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_content_dna():
     """Create a minimal ContentDNA with empty fields."""
     return ContentDNA(
@@ -35,7 +36,7 @@ def minimal_content_dna():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_validation_result():
     """Create a sample ValidationResult."""
     return ValidationResult(
@@ -46,7 +47,7 @@ def sample_validation_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_validation_result():
     """Create a failing ValidationResult."""
     return ValidationResult(
@@ -57,7 +58,7 @@ def failing_validation_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_platform_content(sample_validation_result):
     """Create a sample PlatformContent."""
     return PlatformContent(
@@ -69,7 +70,7 @@ def sample_platform_content(sample_validation_result):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_publish_result():
     """Create a sample PublishResult."""
     return PublishResult(
@@ -81,6 +82,12 @@ def sample_publish_result():
     )
 
 
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry failed LLM calls immediately; tests that exhaust retries would otherwise sleep 3s."""
+    monkeypatch.setattr("core.platform_engine.INITIAL_BACKOFF", 0)
+
+
 @pytest.fixture
 def mock_llm_response():
     """Mock LLM completion response."""
@@ -0,0 +1,16 @@
+"""Shared builders for the platform adapter tests."""
+from core.models import PlatformContent, ValidationResult
+
+# validate_content builds its own result and never reads the one on its input
+EMPTY_VALIDATION = ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
+
+
+def platform_content(platform, title="", body="", **metadata):
+    """Wrap a title, body and metadata in PlatformContent the way generate_content does."""
+    return PlatformContent(
+        platform=platform,
+        title=title,
+        body=body,
+        metadata=metadata,
+        validation=EMPTY_VALIDATION
+    )
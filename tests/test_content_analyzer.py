@@ -82,7 +82,7 @@ class TestContentAnalyzer:
         result = analyzer.analyze("Content")
 
         assert result.value_proposition == "Partial response"
-        assert result.technical_details == []
+        assert result.technical_details == ()
         assert result.problem_solved == ""
         assert result.content_type == "announcement"  # Default
 
@@ -96,7 +96,7 @@ class TestContentAnalyzer:
 
         assert isinstance(result, ContentDNA)
         assert "Error" in result.value_proposition
-        assert result.technical_details == []
+        assert result.technical_details == ()
 
     @patch('litellm.completion')
     def test_analyze_handles_invalid_json(self, mock_completion):
@@ -68,7 +68,7 @@ class TestDNAExtractorExtraction:
         result = extractor.extract_dna("Content")
 
         assert result.value_proposition == "Partial"
-        assert result.technical_details == []
+        assert result.technical_details == ()
         assert result.target_audience == "general"
 
     @patch('core.dna_extractor.PlatformAdapter')
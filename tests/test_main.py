@@ -2,9 +2,11 @@
 import pytest
 import os
 import sys
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from io import StringIO
+from types import SimpleNamespace
 
 
 class TestLoadContent:
@@ -45,18 +47,18 @@ class TestSaveArtifact:
         assert output_file.exists()
         assert "Test content here" in output_file.read_text()
 
-    def test_save_artifact_creates_directory(self, tmp_path, monkeypatch):
+    def test_save_artifact_creates_directory(self, tmp_path):
         """Test save_artifact creates artifacts directory if needed."""
         from main import save_artifact
 
-        monkeypatch.chdir(tmp_path)
-        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir = tmp_path / "nested" / "artifacts"
 
         assert not artifacts_dir.exists()
 
-        save_artifact("platform", "Content", None)
+        save_artifact("platform", "Content", None, out_dir=artifacts_dir)
 
         assert artifacts_dir.exists()
+        assert (artifacts_dir / "platform_post.md").read_text() == "Content"
 
     def test_save_artifact_overwrites_existing(self, tmp_path, monkeypatch):
         """Test save_artifact overwrites existing file."""
@@ -240,13 +242,13 @@ class TestAdapterRegistry:
         for platform, adapter_class in ADAPTER_REGISTRY.items():
             assert issubclass(adapter_class, PlatformAdapter), f"Invalid adapter for {platform}"
 
-    def test_registry_adapters_can_be_instantiated(self, tmp_path):
+    def test_registry_adapters_can_be_instantiated(self, tmp_path_factory):
         """Test registry adapters can be instantiated."""
         from main import ADAPTER_REGISTRY
 
+        # Adapters only read profile.yaml, so one empty directory serves all
+        config_dir = tmp_path_factory.mktemp("adapters")
         for platform, adapter_class in ADAPTER_REGISTRY.items():
-            config_dir = tmp_path / platform
-            config_dir.mkdir()
             adapter = adapter_class(config_dir)
             assert adapter is not None
             assert hasattr(adapter, "generate_content")
@@ -256,41 +258,145 @@ class TestAdapterRegistry:
 class TestMainFunction:
     """Tests for main function."""
 
+    PLATFORMS = ("hackernews", "twitter", "linkedin")
+
+    @pytest.fixture
+    def stubbed_main(self, tmp_path, monkeypatch):
+        """Import main with I/O, analysis and adapters replaced by plain stubs."""
+        import main
+        from core.models import ContentDNA, UserProfile
+
+        dna = ContentDNA(
+            value_proposition="Test tool",
+            technical_details=[],
+            problem_solved="Testing",
+            target_audience="Developers",
+            key_metrics=[],
+            unique_aspects=[],
+            limitations=[],
+            content_type="tool_launch"
+        )
+        adapter = SimpleNamespace(
+            generate_content=lambda dna: SimpleNamespace(title="Test", body="Body", metadata={}),
+            validate_content=lambda content: SimpleNamespace(
+                is_valid=True, errors=[], warnings=[], suggestions=[]
+            )
+        )
+        analyzer = MagicMock()
+        analyzer.analyze.return_value = dna
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(main, "load_config", lambda: {"llm": {"default_model": "gpt-4o"}})
+        monkeypatch.setattr(main, "load_content", lambda path: "Test content")
+        monkeypatch.setattr(main, "ContentAnalyzer", lambda model: analyzer)
+        monkeypatch.setattr(main, "load_saved_profile", lambda: UserProfile([], "", []))
+        monkeypatch.setattr(main, "quick_stage_prompt", lambda: "mvp")
+        monkeypatch.setattr(
+            main, "ADAPTER_REGISTRY", {name: lambda config_dir, model: adapter for name in self.PLATFORMS}
+        )
+        return SimpleNamespace(main=main, analyzer=analyzer, artifacts=tmp_path / "artifacts")
+
     @patch('main.setup_environment')
-    @patch('main.load_config')
-    @patch('main.load_content')
-    @patch('main.ContentAnalyzer')
-    def test_main_calls_setup(self, mock_analyzer, mock_load, mock_config, mock_setup):
+    def test_main_calls_setup(self, mock_setup, stubbed_main, monkeypatch):
         """Test main calls setup_environment."""
-        mock_config.return_value = {"llm": {"default_model": "gpt-4o"}}
-        mock_load.return_value = "Test content"
-
-        mock_dna = MagicMock()
-        mock_analyzer_instance = MagicMock()
-        mock_analyzer_instance.analyze.return_value = mock_dna
-        mock_analyzer.return_value = mock_analyzer_instance
-
-        with patch('sys.argv', ['main.py', 'test.md', '--platforms', 'hackernews']):
-            with patch('main.ADAPTER_REGISTRY') as mock_registry:
-                mock_adapter = MagicMock()
-                mock_adapter.generate_content.return_value = MagicMock(
-                    title="Test", body="Body", metadata={}
-                )
-                mock_adapter.validate_content.return_value = MagicMock(
+        monkeypatch.setattr(sys, "argv", ["main.py", "test.md", "--platforms", "hackernews"])
+
+        stubbed_main.main.main()
+
+        mock_setup.assert_called_once()
+        assert (stubbed_main.artifacts / "hackernews_post.md").exists()
+
+    @patch('main.setup_environment')
+    def test_main_analyzes_content_once(self, mock_setup, stubbed_main, monkeypatch):
+        """Test DNA is extracted once and reused for every platform."""
+        monkeypatch.setattr(sys, "argv", ["main.py", "test.md", "--platforms", *self.PLATFORMS])
+
+        stubbed_main.main.main()
+
+        stubbed_main.analyzer.analyze.assert_called_once_with("Test content")
+        for platform in self.PLATFORMS:
+            assert (stubbed_main.artifacts / f"{platform}_post.md").exists()
+
+    @patch('main.setup_environment')
+    def test_main_isolates_failed_generation(self, mock_setup, stubbed_main, monkeypatch, capsys):
+        """Test one platform's failed generation doesn't stop the others."""
+        def broken_adapter(config_dir, model):
+            raise RuntimeError("LLM unavailable")
+
+        monkeypatch.setitem(stubbed_main.main.ADAPTER_REGISTRY, "twitter", broken_adapter)
+        monkeypatch.setattr(sys, "argv", ["main.py", "test.md", "--platforms", *self.PLATFORMS])
+
+        stubbed_main.main.main()
+
+        assert "Failed: LLM unavailable" in capsys.readouterr().out
+        assert not (stubbed_main.artifacts / "twitter_post.md").exists()
+        assert (stubbed_main.artifacts / "hackernews_post.md").exists()
+        assert (stubbed_main.artifacts / "linkedin_post.md").exists()
+
+    @patch('main.setup_environment')
+    def test_main_reports_generation_output_under_its_platform(self, mock_setup, stubbed_main, monkeypatch, capsys):
+        """Test what a generation prints is shown under its own header, even when another finishes first."""
+        first_may_finish = threading.Event()
+
+        def noisy_adapter(name, wait_for=None, release=None):
+            def generate_content(dna):
+                if wait_for:
+                    wait_for.wait(timeout=5)
+                print(f"   Retry 1/3 for {name}")
+                if release:
+                    release.set()
+                return SimpleNamespace(title="Test", body="Body", metadata={})
+
+            adapter = SimpleNamespace(
+                generate_content=generate_content,
+                validate_content=lambda content: SimpleNamespace(
                     is_valid=True, errors=[], warnings=[], suggestions=[]
                 )
-                mock_registry.__getitem__.return_value = lambda *args, **kwargs: mock_adapter
-                mock_registry.keys.return_value = ["hackernews"]
-                mock_registry.__contains__ = lambda self, x: x == "hackernews"
-
-                try:
-                    from main import main
-                    # This would need more complex mocking for full test
-                except Exception:
-                    pass
-
-        # Verify setup was called is the key assertion
-        # Full main() testing would require extensive mocking
+            )
+            return lambda config_dir, model: adapter
+
+        # hackernews can only finish after twitter has printed its own line
+        monkeypatch.setitem(stubbed_main.main.ADAPTER_REGISTRY, "hackernews",
+                            noisy_adapter("hackernews", wait_for=first_may_finish))
+        monkeypatch.setitem(stubbed_main.main.ADAPTER_REGISTRY, "twitter",
+                            noisy_adapter("twitter", release=first_may_finish))
+        monkeypatch.setattr(sys, "argv", ["main.py", "test.md", "--platforms", "hackernews", "twitter"])
+
+        stubbed_main.main.main()
+
+        out = capsys.readouterr().out
+        order = [
+            out.index("Processing: HACKERNEWS"), out.index("Retry 1/3 for hackernews"),
+            out.index("Processing: TWITTER"), out.index("Retry 1/3 for twitter"),
+        ]
+        assert order == sorted(order)
+        assert not isinstance(sys.stdout, stubbed_main.main.GenerationOutput)
+
+    @patch('main.setup_environment')
+    def test_main_generates_repeated_platform_once(self, mock_setup, stubbed_main, monkeypatch, capsys):
+        """Test a platform named twice in --platforms is generated and reported once."""
+        calls = []
+
+        def generate_content(dna):
+            calls.append(dna)
+            print("   Retry 1/3 for twitter")
+            return SimpleNamespace(title="Test", body="Body", metadata={})
+
+        adapter = SimpleNamespace(
+            generate_content=generate_content,
+            validate_content=lambda content: SimpleNamespace(
+                is_valid=True, errors=[], warnings=[], suggestions=[]
+            )
+        )
+        monkeypatch.setitem(stubbed_main.main.ADAPTER_REGISTRY, "twitter", lambda config_dir, model: adapter)
+        monkeypatch.setattr(sys, "argv", ["main.py", "test.md", "--platforms", "twitter", "twitter"])
+
+        stubbed_main.main.main()
+
+        out = capsys.readouterr().out
+        assert len(calls) == 1
+        assert out.count("Processing: TWITTER") == 1
+        assert out.count("Retry 1/3 for twitter") == 1
 
 
 class TestArgumentParsing:
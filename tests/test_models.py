@@ -1,5 +1,6 @@
 """Tests for core/models.py - Data models."""
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from core.models import ContentDNA, ValidationResult, PlatformContent, PublishResult, PostStatus
 
 
@@ -39,7 +40,7 @@ class TestContentDNA:
         """Test ContentDNA with minimal/empty fields."""
         dna = minimal_content_dna
         assert dna.value_proposition == "Simple tool"
-        assert dna.technical_details == []
+        assert dna.technical_details == ()
         assert dna.problem_solved == ""
 
     def test_content_dna_all_fields(self):
@@ -57,21 +58,31 @@ class TestContentDNA:
         assert len(dna.technical_details) == 2
         assert dna.content_type == "tutorial"
 
-    def test_content_dna_field_types(self):
-        """Test ContentDNA field types are correct."""
+    def test_content_dna_normalizes_sequences(self):
+        """Test list and None sequence fields are stored as tuples."""
         dna = ContentDNA(
             value_proposition="",
-            technical_details=[],
+            technical_details=["Python", "Rust"],
             problem_solved="",
             target_audience="",
-            key_metrics=[],
+            key_metrics=None,
             unique_aspects=[],
             limitations=[],
-            content_type=""
+            content_type="",
+            best_fit_communities=None
         )
-        assert isinstance(dna.value_proposition, str)
-        assert isinstance(dna.technical_details, list)
-        assert isinstance(dna.key_metrics, list)
+        assert dna.technical_details == ("Python", "Rust")
+        assert dna.key_metrics == ()
+        assert dna.best_fit_communities == ()
+        assert dna.visual_opportunities == ()
+
+    def test_content_dna_is_frozen(self, sample_content_dna):
+        """Test ContentDNA rejects reassignment; variants go through dataclasses.replace."""
+        with pytest.raises(FrozenInstanceError):
+            sample_content_dna.project_stage = "beta"
+        staged = replace(sample_content_dna, project_stage="beta")
+        assert staged.project_stage == "beta"
+        assert sample_content_dna.project_stage == "unknown"
 
 
 class TestValidationResult:
@@ -117,6 +128,25 @@ class TestValidationResult:
         assert len(result.errors) == 1
         assert len(result.suggestions) == 3
 
+    def test_validation_result_is_frozen(self, sample_validation_result):
+        """Test ValidationResult rejects attribute reassignment."""
+        with pytest.raises(FrozenInstanceError):
+            sample_validation_result.is_valid = False
+
+    def test_validation_result_has(self, failing_validation_result):
+        """Test has() matches substrings case-insensitively per message kind."""
+        result = failing_validation_result
+        assert result.has("errors", "FORBIDDEN")
+        assert result.has("warnings", "too long")
+        assert not result.has("errors", "too long")
+        assert not result.has("suggestions", "missing")
+
+    def test_validation_result_has_requires_all_texts_in_one_message(self, failing_validation_result):
+        """Test has() with several texts matches only when one message contains them all."""
+        result = failing_validation_result
+        assert result.has("errors", "missing", "field")
+        assert not result.has("errors", "missing", "forbidden")
+
 
 class TestPlatformContent:
     """Tests for PlatformContent dataclass."""
@@ -260,3 +290,9 @@ class TestModelIntegration:
 
         assert valid_content.validation.is_valid is True
         assert invalid_content.validation.is_valid is False
+
+    def test_models_are_slotted(self, sample_content_dna, sample_platform_content, sample_publish_result):
+        """Test model instances carry no per-instance __dict__."""
+        for instance in (sample_content_dna, sample_platform_content,
+                         sample_platform_content.validation, sample_publish_result):
+            assert not hasattr(instance, "__dict__")
@@ -1,12 +1,19 @@
 """Tests for core/platform_engine.py - PlatformAdapter and Validator base classes."""
 import pytest
 import json
+import litellm
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-from core.platform_engine import PlatformAdapter, Validator
+from types import SimpleNamespace
+from unittest.mock import patch
+from core.platform_engine import PlatformAdapter, Validator, MAX_RETRIES
 from core.models import ContentDNA, PlatformContent, ValidationResult
 
 
+def _llm_response(content):
+    """Shape of a litellm completion response, as far as _make_llm_call reads it."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
 class ConcretePlatformAdapter(PlatformAdapter):
     """Concrete implementation for testing abstract class."""
 
@@ -30,6 +37,12 @@ class ConcreteValidator(Validator):
         return ValidationResult(is_valid=True, warnings=[], errors=[], suggestions=[])
 
 
+@pytest.fixture(scope="module")
+def adapter(tmp_path_factory):
+    """Shared adapter for the parsing and LLM call tests; none of them keeps changes to it."""
+    return ConcretePlatformAdapter(tmp_path_factory.mktemp("test"))
+
+
 class TestPlatformAdapter:
     """Tests for PlatformAdapter base class."""
 
@@ -74,16 +87,20 @@ forbidden_words:
         assert adapter.profile.get("max_length") == 100
         assert "spam" in adapter.profile.get("forbidden_words", [])
 
+    def test_load_profile_is_private_to_each_adapter(self, mock_config_dir):
+        """Test adapters never share one profile dict and pick up an edited profile.yaml."""
+        profile_path = mock_config_dir / "profile.yaml"
+        profile_path.write_text("max_length: 100\n")
+        first = ConcretePlatformAdapter(mock_config_dir).profile
+        assert ConcretePlatformAdapter(mock_config_dir).profile is not first
+
+        profile_path.write_text("max_length: 2500\n")
+        assert ConcretePlatformAdapter(mock_config_dir).profile == {"max_length": 2500}
+
 
 class TestPlatformAdapterJsonParsing:
     """Tests for PlatformAdapter JSON parsing."""
 
-    @pytest.fixture
-    def adapter(self, tmp_path):
-        config_dir = tmp_path / "test"
-        config_dir.mkdir()
-        return ConcretePlatformAdapter(config_dir)
-
     def test_parse_json_response_direct(self, adapter):
         """Test parsing direct JSON."""
         content = '{"title": "Test", "body": "Content"}'
@@ -114,6 +131,23 @@ class TestPlatformAdapterJsonParsing:
         result = adapter._parse_json_response(content)
         assert result["title"] == "Test"
 
+    def test_parse_json_response_with_trailing_text(self, adapter):
+        """Test parsing JSON followed by prose after the closing brace."""
+        content = '''Here is the response:
+{"title": "Test", "body": "Content"}
+Let me know if you want changes.'''
+        result = adapter._parse_json_response(content)
+        assert result == {"title": "Test", "body": "Content"}
+
+    def test_parse_json_response_with_braces_in_leading_prose(self, adapter):
+        """Test braces in prose before the object don't hide the JSON that follows."""
+        content = '''Use {} placeholders in your templates, like {name}.
+```json
+{"title": "Test", "body": "Content"}
+```'''
+        result = adapter._parse_json_response(content)
+        assert result == {"title": "Test", "body": "Content"}
+
     def test_parse_json_response_with_newlines_in_strings(self, adapter):
         """Test parsing JSON with newlines in string values."""
         content = '''{"title": "Test", "body": "Line 1
@@ -123,6 +157,12 @@ Line 3"}'''
         # Should handle or at least not crash
         assert "title" in result or result == {}
 
+    def test_parse_json_response_escapes_control_chars_only_inside_strings(self, adapter):
+        """Test raw newlines/tabs in strings are escaped while escaped quotes stay intact."""
+        content = '{\n"title": "Say \\"hi\\"",\n"body": "Line 1\nLine 2\tend"\n}'
+        result = adapter._parse_json_response(content)
+        assert result == {"title": 'Say "hi"', "body": "Line 1\nLine 2\tend"}
+
     def test_parse_json_response_invalid_json(self, adapter):
         """Test parsing invalid JSON returns empty dict."""
         content = "This is not JSON at all"
@@ -150,19 +190,10 @@ Line 3"}'''
 class TestPlatformAdapterLLMCall:
     """Tests for PlatformAdapter _make_llm_call method."""
 
-    @pytest.fixture
-    def adapter(self, tmp_path):
-        config_dir = tmp_path / "test"
-        config_dir.mkdir()
-        return ConcretePlatformAdapter(config_dir)
-
     @patch('litellm.completion')
     def test_make_llm_call_basic(self, mock_completion, adapter):
         """Test basic LLM call."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"title": "Test"}'
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = _llm_response('{"title": "Test"}')
 
         result = adapter._make_llm_call("Test prompt")
 
@@ -172,10 +203,7 @@ class TestPlatformAdapterLLMCall:
     @patch('litellm.completion')
     def test_make_llm_call_with_system_prompt(self, mock_completion, adapter):
         """Test LLM call with system prompt."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"result": "ok"}'
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = _llm_response('{"result": "ok"}')
 
         adapter._make_llm_call("User prompt", system_prompt="System prompt")
 
@@ -188,10 +216,7 @@ class TestPlatformAdapterLLMCall:
     @patch('litellm.completion')
     def test_make_llm_call_without_system_prompt(self, mock_completion, adapter):
         """Test LLM call without system prompt."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"result": "ok"}'
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = _llm_response('{"result": "ok"}')
 
         adapter._make_llm_call("User prompt only")
 
@@ -201,13 +226,10 @@ class TestPlatformAdapterLLMCall:
         assert messages[0]["role"] == "user"
 
     @patch('litellm.completion')
-    def test_make_llm_call_uses_adapter_model(self, mock_completion, adapter):
+    def test_make_llm_call_uses_adapter_model(self, mock_completion, adapter, monkeypatch):
         """Test LLM call uses adapter's model."""
-        adapter.model = "test-model-123"
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"result": "ok"}'
-        mock_completion.return_value = mock_response
+        monkeypatch.setattr(adapter, "model", "test-model-123")
+        mock_completion.return_value = _llm_response('{"result": "ok"}')
 
         adapter._make_llm_call("Prompt")
 
@@ -217,12 +239,59 @@ class TestPlatformAdapterLLMCall:
 
     @patch('litellm.completion')
     def test_make_llm_call_handles_exception(self, mock_completion, adapter):
-        """Test LLM call handles exceptions gracefully."""
-        mock_completion.side_effect = Exception("API Error")
+        """Test LLM call retries transient errors, then returns empty dict."""
+        mock_completion.side_effect = litellm.APIConnectionError(
+            message="API Error", llm_provider="openai", model="gpt-4o"
+        )
 
         result = adapter._make_llm_call("Prompt")
 
         assert result == {}
+        assert mock_completion.call_count == MAX_RETRIES
+
+    @pytest.mark.parametrize("error", [
+        pytest.param(litellm.BadGatewayError(message="502", llm_provider="openai", model="gpt-4o"),
+                     id="bad-gateway"),
+        pytest.param(litellm.APIError(status_code=500, message="500", llm_provider="openai", model="gpt-4o"),
+                     id="generic-api-error"),
+    ])
+    @patch('litellm.completion')
+    def test_make_llm_call_retries_server_errors(self, mock_completion, adapter, error):
+        """Test any 5xx from the provider is retried, not just the named litellm classes."""
+        mock_completion.side_effect = [error, _llm_response('{"title": "Test"}')]
+
+        assert adapter._make_llm_call("Prompt") == {"title": "Test"}
+        assert mock_completion.call_count == 2
+
+    @patch('litellm.completion')
+    def test_make_llm_call_propagates_client_error(self, mock_completion, adapter):
+        """Test a 4xx such as a bad API key fails on the first attempt."""
+        mock_completion.side_effect = litellm.AuthenticationError(
+            message="bad key", llm_provider="openai", model="gpt-4o"
+        )
+
+        with pytest.raises(litellm.AuthenticationError):
+            adapter._make_llm_call("Prompt")
+
+        assert mock_completion.call_count == 1
+
+    @patch('litellm.completion')
+    def test_make_llm_call_handles_missing_content(self, mock_completion, adapter):
+        """Test a reply without message content (content filter, tool call) returns an empty dict."""
+        mock_completion.return_value = _llm_response(None)
+
+        assert adapter._make_llm_call("Prompt") == {}
+        mock_completion.assert_called_once()
+
+    @patch('litellm.completion')
+    def test_make_llm_call_propagates_unexpected_exception(self, mock_completion, adapter):
+        """Test LLM call does not retry or swallow non-transient errors."""
+        mock_completion.side_effect = ValueError("bad request")
+
+        with pytest.raises(ValueError, match="bad request"):
+            adapter._make_llm_call("Prompt")
+
+        assert mock_completion.call_count == 1
 
 
 class TestValidator:
@@ -1,20 +1,33 @@
 """Tests for platforms/producthunt/adapter.py - ProducthuntAdapter."""
+import copy
 import pytest
 from pathlib import Path
 from unittest.mock import patch
-from core.models import ContentDNA, ValidationResult, PlatformContent
+from core.models import ContentDNA, PlatformContent
 from platforms.producthunt.adapter import ProducthuntAdapter
+from tests.helpers import platform_content
+
+# Launch metadata that passes every check; each case works on its own deep copy
+_VALID_META = {
+    "tagline": "The keyboard for coders who hate leaving the home row",
+    "description": "A productivity tool that helps developers write code faster using vim-style navigation everywhere.",
+    "first_comment": """Hey Product Hunt! I built this because I was tired of reaching for my mouse. What started as a side project turned into something I use every day. Would love to hear what features you'd want to see next?""",
+    "topics": ["Developer Tools", "Productivity"],
+    "media_suggestions": [
+        {"type": "gif", "description": "Main workflow demo"}
+    ]
+}
+
+
+@pytest.fixture(scope="module")
+def adapter(tmp_path_factory):
+    config_dir = tmp_path_factory.mktemp("producthunt")
+    return ProducthuntAdapter(config_dir)
 
 
 class TestProducthuntAdapter:
     """Tests for ProducthuntAdapter class."""
 
-    @pytest.fixture
-    def adapter(self, tmp_path):
-        config_dir = tmp_path / "producthunt"
-        config_dir.mkdir()
-        return ProducthuntAdapter(config_dir)
-
     def test_adapter_initialization(self, adapter):
         """Test adapter initializes correctly."""
         assert adapter.model == "gpt-4o"
@@ -23,234 +36,33 @@ class TestProducthuntAdapter:
 class TestProducthuntAdapterValidation:
     """Tests for ProducthuntAdapter validate_content method."""
 
-    @pytest.fixture
-    def adapter(self, tmp_path):
-        config_dir = tmp_path / "producthunt"
-        config_dir.mkdir()
-        return ProducthuntAdapter(config_dir)
-
-    def test_validate_missing_tagline(self, adapter):
-        """Test validation catches missing tagline."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={"tagline": "", "description": "Desc", "first_comment": "Comment", "topics": []},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert result.is_valid is False
-        assert any("tagline" in e.lower() for e in result.errors)
-
-    def test_validate_tagline_too_long(self, adapter):
-        """Test validation catches overly long tagline."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "x" * 100,
-                "description": "Desc",
-                "first_comment": "Comment here",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert result.is_valid is False
-        assert any("80" in e for e in result.errors)
-
-    def test_validate_tagline_too_short(self, adapter):
-        """Test validation warns about very short tagline."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Short",
-                "description": "Description here",
-                "first_comment": "This is my maker comment with enough content.",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("short" in w.lower() for w in result.warnings)
-
-    def test_validate_description_too_long(self, adapter):
-        """Test validation catches description over 260 chars."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "x" * 300,
-                "first_comment": "Maker comment here.",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert result.is_valid is False
-        assert any("260" in e for e in result.errors)
-
-    def test_validate_missing_first_comment(self, adapter):
-        """Test validation catches missing first comment."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert result.is_valid is False
-        assert any("first comment" in e.lower() or "maker" in e.lower() for e in result.errors)
-
-    def test_validate_first_comment_too_short(self, adapter):
-        """Test validation warns about short first comment."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Short comment.",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("short" in w.lower() for w in result.warnings)
-
-    def test_validate_first_comment_too_long(self, adapter):
-        """Test validation warns about very long first comment."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "x" * 1200,
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("long" in w.lower() for w in result.warnings)
-
-    def test_validate_missing_question_in_comment(self, adapter):
-        """Test validation suggests question in first comment."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Here is my maker story. I built this tool because reasons. It helps with things.",
-                "topics": ["DevTools"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("question" in s.lower() for s in result.suggestions)
-
-    def test_validate_no_topics(self, adapter):
-        """Test validation warns about missing topics."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Maker comment here with enough content?",
-                "topics": []
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("topic" in w.lower() for w in result.warnings)
-
-    def test_validate_too_many_topics(self, adapter):
-        """Test validation warns about too many topics."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Maker comment here?",
-                "topics": ["One", "Two", "Three", "Four", "Five"]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("topic" in w.lower() for w in result.warnings)
-
-    def test_validate_no_media_suggestions(self, adapter):
-        """Test validation warns about missing media."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Maker comment?",
-                "topics": ["DevTools"],
-                "media_suggestions": []
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+    @pytest.mark.parametrize("override,bucket,needle", [
+        pytest.param({"tagline": ""}, "errors", "tagline", id="missing-tagline"),
+        pytest.param({"tagline": "x" * 100}, "errors", "80", id="tagline-too-long"),
+        pytest.param({"tagline": "Short"}, "warnings", "short", id="tagline-too-short"),
+        pytest.param({"description": "x" * 300}, "errors", "260", id="description-too-long"),
+        pytest.param({"first_comment": ""}, "errors", "first comment", id="missing-first-comment"),
+        pytest.param({"first_comment": "Short comment."}, "warnings", "short", id="first-comment-too-short"),
+        pytest.param({"first_comment": "x" * 1200}, "warnings", "long", id="first-comment-too-long"),
+        pytest.param({"first_comment": "Here is my maker story. I built this tool because reasons. It helps with things."},
+                     "suggestions", "question", id="missing-question-in-comment"),
+        pytest.param({"topics": []}, "warnings", "topic", id="no-topics"),
+        pytest.param({"topics": ["One", "Two", "Three", "Four", "Five"]}, "warnings", "topic", id="too-many-topics"),
+        pytest.param({"media_suggestions": []}, "warnings", "media", id="no-media-suggestions"),
+        pytest.param({"media_suggestions": [{"type": "screenshot", "description": "Main view"}]},
+                     "suggestions", "gif", id="missing-gif-suggestion"),
+    ])
+    def test_validate_flags_issue(self, adapter, override, bucket, needle):
+        """Test validation reports each rule violation in the expected bucket."""
+        content = platform_content("producthunt", **copy.deepcopy({**_VALID_META, **override}))
         result = adapter.validate_content(content)
-        assert any("media" in w.lower() for w in result.warnings)
-
-    def test_validate_missing_gif_suggestion(self, adapter):
-        """Test validation suggests GIF if not present."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "Good tagline for the product",
-                "description": "Description",
-                "first_comment": "Maker comment?",
-                "topics": ["DevTools"],
-                "media_suggestions": [{"type": "screenshot", "description": "Main view"}]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
-        result = adapter.validate_content(content)
-        assert any("gif" in s.lower() for s in result.suggestions)
+        if bucket == "errors":
+            assert result.is_valid is False
+        assert result.has(bucket, needle)
 
     def test_validate_valid_content(self, adapter):
         """Test validation passes for valid content."""
-        content = PlatformContent(
-            platform="producthunt",
-            title="",
-            body="",
-            metadata={
-                "tagline": "The keyboard for coders who hate leaving the home row",
-                "description": "A productivity tool that helps developers write code faster using vim-style navigation everywhere.",
-                "first_comment": """Hey Product Hunt! I built this because I was tired of reaching for my mouse. What started as a side project turned into something I use every day. Would love to hear what features you'd want to see next?""",
-                "topics": ["Developer Tools", "Productivity"],
-                "media_suggestions": [
-                    {"type": "gif", "description": "Main workflow demo"}
-                ]
-            },
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("producthunt", **copy.deepcopy(_VALID_META))
         result = adapter.validate_content(content)
         assert result.is_valid is True
         assert len(result.errors) == 0
@@ -259,12 +71,6 @@ class TestProducthuntAdapterValidation:
 class TestProducthuntAdapterGeneration:
     """Tests for ProducthuntAdapter content generation."""
 
-    @pytest.fixture
-    def adapter(self, tmp_path):
-        config_dir = tmp_path / "producthunt"
-        config_dir.mkdir()
-        return ProducthuntAdapter(config_dir)
-
     @pytest.fixture
     def sample_dna(self):
         return ContentDNA(
@@ -2,8 +2,9 @@
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from core.models import ContentDNA, ValidationResult, PlatformContent
+from core.models import ContentDNA, PlatformContent
 from platforms.reddit.adapter import RedditAdapter
+from tests.helpers import platform_content
 
 
 class TestRedditAdapter:
@@ -88,26 +89,14 @@ class TestRedditAdapterValidation:
 
     def test_validate_no_posts(self, adapter):
         """Test validation with no posts."""
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": []},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=[])
         result = adapter.validate_content(content)
         assert result.is_valid is False
-        assert any("no" in e.lower() and "post" in e.lower() for e in result.errors)
+        assert result.has("errors", "no", "post")
 
     def test_validate_missing_posts_key(self, adapter):
         """Test validation with missing posts in metadata."""
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy")
         result = adapter.validate_content(content)
         assert result.is_valid is False
 
@@ -121,13 +110,7 @@ class TestRedditAdapterValidation:
             "why_this_subreddit": "Technical",
             "flair": "Project"
         }]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
         assert result.is_valid is False
         assert any("300" in e for e in result.errors)
@@ -150,13 +133,7 @@ class TestRedditAdapterValidation:
                 "why_this_subreddit": "Technical",
                 "flair": "Project"
             }]
-            content = PlatformContent(
-                platform="reddit",
-                title="Strategy",
-                body="",
-                metadata={"posts": posts},
-                validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-            )
+            content = platform_content("reddit", "Strategy", posts=posts)
             result = adapter.validate_content(content)
             assert any("promotional" in w.lower() for w in result.warnings), f"Should warn for: {title}"
 
@@ -170,13 +147,7 @@ class TestRedditAdapterValidation:
             "why_this_subreddit": "Technical",
             "flair": "Project"
         }]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
         assert any("short" in w.lower() for w in result.warnings)
 
@@ -190,13 +161,7 @@ class TestRedditAdapterValidation:
             "why_this_subreddit": "Technical",
             "flair": "Project"
         }]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
         assert any("long" in w.lower() for w in result.warnings)
 
@@ -205,21 +170,57 @@ class TestRedditAdapterValidation:
         posts = [{
             "subreddit": "programming",
             "title": "Cool tool check it out",
-            "body": "This is a great tool for developers! ",
+            "body": "This is a great tool for developers! 🚀",
             "framing": "discovery",
             "why_this_subreddit": "Technical",
             "flair": "Project"
         }]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
         assert any("emoji" in w.lower() for w in result.warnings)
 
+    def test_validate_supplemental_emoji_in_title(self, adapter):
+        """Test validation warns about emoji from the supplemental pictograph block."""
+        posts = [{
+            "subreddit": "programming",
+            "title": "Why did my parser get 3x faster? 🤔",
+            "body": "A" * 150,
+            "framing": "discussion",
+            "why_this_subreddit": "Technical",
+            "flair": "Discussion"
+        }]
+        content = platform_content("reddit", "Strategy", posts=posts)
+        result = adapter.validate_content(content)
+        assert any("emoji" in w.lower() for w in result.warnings)
+
+    @pytest.mark.parametrize("emoji", ["🟢", "✅", "✨", "❤", "⚡"],
+                             ids=["colored-circle", "check-button", "sparkles", "heart", "zap"])
+    def test_validate_emoji_outside_pictograph_blocks(self, adapter, emoji):
+        """Test validation warns about geometric-shape emoji and emoji-styled dingbats."""
+        posts = [{
+            "subreddit": "programming",
+            "title": "Parser benchmarks",
+            "body": f"All green {emoji} " + "A" * 150,
+            "framing": "discussion",
+            "why_this_subreddit": "Technical",
+            "flair": "Discussion"
+        }]
+        result = adapter.validate_content(platform_content("reddit", "Strategy", posts=posts))
+        assert result.has("warnings", "emoji")
+
+    def test_validate_plain_check_mark_is_not_emoji(self, adapter):
+        """Test text marks from the dingbat block such as ✓ are not flagged."""
+        posts = [{
+            "subreddit": "programming",
+            "title": "Parser benchmarks",
+            "body": "✓ tokenizer ✓ parser " + "A" * 150,
+            "framing": "discussion",
+            "why_this_subreddit": "Technical",
+            "flair": "Discussion"
+        }]
+        result = adapter.validate_content(platform_content("reddit", "Strategy", posts=posts))
+        assert not result.has("warnings", "emoji")
+
     def test_validate_link_at_start(self, adapter):
         """Test validation warns about body starting with link."""
         posts = [{
@@ -230,15 +231,23 @@ class TestRedditAdapterValidation:
             "why_this_subreddit": "Technical",
             "flair": "Project"
         }]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
-        assert any("link" in w.lower() and "start" in w.lower() for w in result.warnings)
+        assert result.has("warnings", "link", "start")
+
+    def test_validate_word_starting_with_http_is_not_link(self, adapter):
+        """Test validation does not mistake a leading word like 'httpx' for a link."""
+        posts = [{
+            "subreddit": "python",
+            "title": "Async HTTP clients compared",
+            "body": "httpx and aiohttp both support HTTP/2 in some form. " * 3,
+            "framing": "discussion",
+            "why_this_subreddit": "Technical",
+            "flair": "Discussion"
+        }]
+        content = platform_content("reddit", "Strategy", posts=posts)
+        result = adapter.validate_content(content)
+        assert not result.has("warnings", "link")
 
     def test_validate_valid_posts(self, adapter):
         """Test validation passes for valid posts."""
@@ -269,13 +278,7 @@ class TestRedditAdapterValidation:
                 "flair": "Discussion"
             }
         ]
-        content = PlatformContent(
-            platform="reddit",
-            title="Strategy: 2 posts",
-            body="",
-            metadata={"posts": posts},
-            validation=ValidationResult(is_valid=False, warnings=[], errors=[], suggestions=[])
-        )
+        content = platform_content("reddit", "Strategy", posts=posts)
         result = adapter.validate_content(content)
         assert result.is_valid is True
         assert len(result.errors) == 0
@@ -1,14 +1,25 @@
 """Tests for platforms/reddit/analyzer.py - SubredditAnalyzer class."""
+import re
 import pytest
 import yaml
+from dataclasses import replace
 from pathlib import Path
 from core.models import ContentDNA
 from platforms.reddit.analyzer import SubredditAnalyzer
 
+# libyaml's C dumper when available, matching the analyzer's C loader
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Primary subreddits for the 'tool' content type in sample_subreddit_data
+_TOOL_PRIMARIES = frozenset({"programming", "webdev"})
+# What the r/programming and r/SideProject variants are expected to lead with
+_PROGRAMMING_ANGLE_RE = re.compile(r"technical|problem|implementation", re.IGNORECASE)
+_LAUNCH_LANGUAGE_RE = re.compile(r"launch|ship|built", re.IGNORECASE)
+_PROBLEM_RE = re.compile(r"problem", re.IGNORECASE)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_subreddit_data():
-    """Create sample subreddit data."""
+    """Create sample subreddit data; shared read-only across the module."""
     return {
         "content_types": {
             "tool": {
@@ -70,16 +81,22 @@ def sample_subreddit_data():
     }
 
 
-@pytest.fixture
-def config_dir(tmp_path, sample_subreddit_data):
-    """Create config directory with subreddit data."""
-    config_path = tmp_path / "subreddit_data.yaml"
-    with open(config_path, 'w') as f:
-        yaml.dump(sample_subreddit_data, f)
-    return tmp_path
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory, sample_subreddit_data):
+    """Write the subreddit data once per module; the analyzer only reads it."""
+    config_dir = tmp_path_factory.mktemp("reddit")
+    with open(config_dir / "subreddit_data.yaml", 'w') as f:
+        yaml.dump(sample_subreddit_data, f, Dumper=_YAML_DUMPER)
+    return config_dir
+
+
+@pytest.fixture(scope="module")
+def analyzer(config_dir):
+    """Load the sample config once; selection and scoring never mutate it."""
+    return SubredditAnalyzer(config_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_dna():
     """Create sample ContentDNA for testing."""
     return ContentDNA(
@@ -94,18 +111,45 @@ def sample_dna():
     )
 
 
+@pytest.fixture(scope="module")
+def tool_dna():
+    """Bare-bones 'tool' launch; tests needing a variant derive it with replace()."""
+    return ContentDNA(
+        value_proposition="Tool",
+        technical_details=[],
+        problem_solved="",
+        target_audience="developers",
+        key_metrics=[],
+        unique_aspects=[],
+        limitations=[],
+        content_type="tool"
+    )
+
+
+@pytest.fixture(scope="module")
+def variants_for(analyzer, sample_dna, sample_subreddit_data):
+    """Generate sample_dna's variants for one selected subreddit on first use."""
+    generated = {}
+
+    def get(sub_id):
+        if sub_id not in generated:
+            selected = [{"subreddit": sub_id, "data": sample_subreddit_data["subreddits"][sub_id], "score": 10}]
+            generated[sub_id] = analyzer.generate_reddit_variants(sample_dna, selected)
+        return generated[sub_id]
+
+    return get
+
+
 class TestSubredditAnalyzer:
     """Tests for SubredditAnalyzer class."""
 
-    def test_analyzer_initialization(self, config_dir):
+    def test_analyzer_initialization(self, analyzer):
         """Test analyzer initializes and loads config."""
-        analyzer = SubredditAnalyzer(config_dir)
         assert analyzer.subreddit_data is not None
         assert "subreddits" in analyzer.subreddit_data
 
-    def test_analyzer_loads_subreddits(self, config_dir):
+    def test_analyzer_loads_subreddits(self, analyzer):
         """Test analyzer loads subreddit definitions."""
-        analyzer = SubredditAnalyzer(config_dir)
         assert "programming" in analyzer.subreddit_data["subreddits"]
         assert "webdev" in analyzer.subreddit_data["subreddits"]
 
@@ -113,25 +157,21 @@ class TestSubredditAnalyzer:
 class TestSubredditSelection:
     """Tests for SubredditAnalyzer.select_subreddits method."""
 
-    def test_select_subreddits_returns_list(self, config_dir, sample_dna):
+    def test_select_subreddits_returns_list(self, analyzer, sample_dna):
         """Test select_subreddits returns a list."""
-        analyzer = SubredditAnalyzer(config_dir)
         result = analyzer.select_subreddits(sample_dna)
         assert isinstance(result, list)
 
-    def test_select_subreddits_respects_max_count(self, config_dir, sample_dna):
+    def test_select_subreddits_respects_max_count(self, analyzer, sample_dna):
         """Test select_subreddits respects max_count parameter."""
-        analyzer = SubredditAnalyzer(config_dir)
-
         result_2 = analyzer.select_subreddits(sample_dna, max_count=2)
         assert len(result_2) <= 2
 
         result_5 = analyzer.select_subreddits(sample_dna, max_count=5)
         assert len(result_5) <= 5
 
-    def test_select_subreddits_includes_required_fields(self, config_dir, sample_dna):
+    def test_select_subreddits_includes_required_fields(self, analyzer, sample_dna):
         """Test selected subreddits include required fields."""
-        analyzer = SubredditAnalyzer(config_dir)
         result = analyzer.select_subreddits(sample_dna, max_count=1)
 
         if result:
@@ -141,55 +181,28 @@ class TestSubredditSelection:
             assert "score" in sub
             assert "reason" in sub
 
-    def test_select_subreddits_sorted_by_score(self, config_dir, sample_dna):
+    def test_select_subreddits_sorted_by_score(self, analyzer, sample_dna):
         """Test selected subreddits are sorted by score descending."""
-        analyzer = SubredditAnalyzer(config_dir)
         result = analyzer.select_subreddits(sample_dna, max_count=5)
 
         if len(result) > 1:
             scores = [sub["score"] for sub in result]
             assert scores == sorted(scores, reverse=True)
 
-    def test_select_subreddits_prioritizes_content_type(self, config_dir):
+    def test_select_subreddits_prioritizes_content_type(self, analyzer, tool_dna):
         """Test subreddits matching content type are prioritized."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        tool_dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
-
         result = analyzer.select_subreddits(tool_dna, max_count=3)
         subreddit_ids = [sub["subreddit"] for sub in result]
 
         # Primary subreddits for 'tool' should be present
-        assert "programming" in subreddit_ids or "webdev" in subreddit_ids
+        assert not _TOOL_PRIMARIES.isdisjoint(subreddit_ids)
 
 
 class TestSubredditScoring:
     """Tests for SubredditAnalyzer._calculate_subreddit_score method."""
 
-    def test_score_primary_subreddit_higher(self, config_dir, sample_subreddit_data):
+    def test_score_primary_subreddit_higher(self, analyzer, sample_subreddit_data, tool_dna):
         """Test primary subreddits get higher scores."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
-
         primary_subs = ["programming", "webdev"]
         secondary_subs = ["sideproject", "opensource"]
 
@@ -197,39 +210,26 @@ class TestSubredditScoring:
         side_data = sample_subreddit_data["subreddits"]["sideproject"]
 
         score_primary = analyzer._calculate_subreddit_score(
-            "programming", prog_data, dna, primary_subs, secondary_subs
+            "programming", prog_data, tool_dna, primary_subs, secondary_subs
         )
         score_secondary = analyzer._calculate_subreddit_score(
-            "sideproject", side_data, dna, primary_subs, secondary_subs
+            "sideproject", side_data, tool_dna, primary_subs, secondary_subs
         )
 
         assert score_primary > score_secondary
 
-    def test_score_self_promo_friendly(self, config_dir, sample_subreddit_data):
+    def test_score_self_promo_friendly(self, analyzer, sample_subreddit_data, tool_dna):
         """Test self-promo friendly subreddits get bonus."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
-
         # sideproject has "encouraged" self_promotion
         side_data = sample_subreddit_data["subreddits"]["sideproject"]
         # programming has "limited" self_promotion
         prog_data = sample_subreddit_data["subreddits"]["programming"]
 
         score_encouraged = analyzer._calculate_subreddit_score(
-            "sideproject", side_data, dna, [], []
+            "sideproject", side_data, tool_dna, [], []
         )
         score_limited = analyzer._calculate_subreddit_score(
-            "programming", prog_data, dna, [], []
+            "programming", prog_data, tool_dna, [], []
         )
 
         # Both start at 1.0 base, but self-promo modifies
@@ -239,37 +239,22 @@ class TestSubredditScoring:
 class TestVariantGeneration:
     """Tests for SubredditAnalyzer.generate_reddit_variants method."""
 
-    def test_generate_variants_returns_list(self, config_dir, sample_dna, sample_subreddit_data):
+    def test_generate_variants_returns_list(self, variants_for):
         """Test generate_reddit_variants returns a list."""
-        analyzer = SubredditAnalyzer(config_dir)
-        selected = [
-            {"subreddit": "programming", "data": sample_subreddit_data["subreddits"]["programming"], "score": 10}
-        ]
-
-        result = analyzer.generate_reddit_variants(sample_dna, selected)
+        result = variants_for("programming")
         assert isinstance(result, list)
 
-    def test_generate_variants_includes_subreddit_name(self, config_dir, sample_dna, sample_subreddit_data):
+    def test_generate_variants_includes_subreddit_name(self, variants_for):
         """Test variants include subreddit name."""
-        analyzer = SubredditAnalyzer(config_dir)
-        selected = [
-            {"subreddit": "programming", "data": sample_subreddit_data["subreddits"]["programming"], "score": 10}
-        ]
-
-        result = analyzer.generate_reddit_variants(sample_dna, selected)
+        result = variants_for("programming")
 
         if result:
             assert "subreddit" in result[0]
             assert "r/programming" in result[0]["subreddit"]
 
-    def test_generate_variants_has_title_and_body(self, config_dir, sample_dna, sample_subreddit_data):
+    def test_generate_variants_has_title_and_body(self, variants_for):
         """Test variants have title and body."""
-        analyzer = SubredditAnalyzer(config_dir)
-        selected = [
-            {"subreddit": "webdev", "data": sample_subreddit_data["subreddits"]["webdev"], "score": 10}
-        ]
-
-        result = analyzer.generate_reddit_variants(sample_dna, selected)
+        result = variants_for("webdev")
 
         if result:
             assert "title" in result[0]
@@ -277,52 +262,29 @@ class TestVariantGeneration:
             assert len(result[0]["title"]) > 0
             assert len(result[0]["body"]) > 0
 
-    def test_generate_programming_variant(self, config_dir, sample_dna, sample_subreddit_data):
+    def test_generate_programming_variant(self, variants_for):
         """Test r/programming variant is generated correctly."""
-        analyzer = SubredditAnalyzer(config_dir)
-        selected = [
-            {"subreddit": "programming", "data": sample_subreddit_data["subreddits"]["programming"], "score": 10}
-        ]
-
-        result = analyzer.generate_reddit_variants(sample_dna, selected)
+        result = variants_for("programming")
 
         if result:
             # Should focus on technical content
-            body_lower = result[0]["body"].lower()
-            assert "technical" in body_lower or "problem" in body_lower or "implementation" in body_lower
+            assert _PROGRAMMING_ANGLE_RE.search(result[0]["body"])
 
-    def test_generate_sideproject_variant(self, config_dir, sample_dna, sample_subreddit_data):
+    def test_generate_sideproject_variant(self, variants_for):
         """Test r/SideProject variant is generated correctly."""
-        analyzer = SubredditAnalyzer(config_dir)
-        selected = [
-            {"subreddit": "sideproject", "data": sample_subreddit_data["subreddits"]["sideproject"], "score": 10}
-        ]
-
-        result = analyzer.generate_reddit_variants(sample_dna, selected)
+        result = variants_for("sideproject")
 
         if result:
-            title_lower = result[0]["title"].lower()
             # Should have launch/shipped language
-            assert "launch" in title_lower or "ship" in title_lower or "built" in title_lower or "problem" in result[0]["body"].lower()
+            assert _LAUNCH_LANGUAGE_RE.search(result[0]["title"]) or _PROBLEM_RE.search(result[0]["body"])
 
 
 class TestSelectionReason:
     """Tests for SubredditAnalyzer._get_selection_reason method."""
 
-    def test_reason_includes_culture_info(self, config_dir, sample_subreddit_data):
+    def test_reason_includes_culture_info(self, analyzer, sample_subreddit_data, tool_dna):
         """Test selection reason includes culture information."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=["Python"],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
+        dna = replace(tool_dna, technical_details=["Python"])
 
         sub_data = sample_subreddit_data["subreddits"]["sideproject"]
         reason = analyzer._get_selection_reason("sideproject", sub_data, dna)
@@ -330,23 +292,10 @@ class TestSelectionReason:
         # sideproject has entrepreneur_friendly culture
         assert "entrepreneur" in reason.lower() or "business" in reason.lower() or len(reason) > 0
 
-    def test_reason_mentions_self_promo(self, config_dir, sample_subreddit_data):
+    def test_reason_mentions_self_promo(self, analyzer, sample_subreddit_data, tool_dna):
         """Test selection reason mentions self-promo policy."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
-
         sub_data = sample_subreddit_data["subreddits"]["sideproject"]  # Has "encouraged"
-        reason = analyzer._get_selection_reason("sideproject", sub_data, dna)
+        reason = analyzer._get_selection_reason("sideproject", sub_data, tool_dna)
 
         assert "self-promotion" in reason.lower() or "encourage" in reason.lower() or len(reason) > 0
 
@@ -354,43 +303,21 @@ class TestSelectionReason:
 class TestEdgeCases:
     """Edge case tests for SubredditAnalyzer."""
 
-    def test_empty_content_type(self, config_dir):
+    def test_empty_content_type(self, analyzer, tool_dna):
         """Test handling empty content type."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type=""
-        )
+        dna = replace(tool_dna, content_type="")
 
         result = analyzer.select_subreddits(dna)
         assert isinstance(result, list)
 
-    def test_unknown_content_type(self, config_dir):
+    def test_unknown_content_type(self, analyzer, tool_dna):
         """Test handling unknown content type."""
-        analyzer = SubredditAnalyzer(config_dir)
-
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="unknown_type"
-        )
+        dna = replace(tool_dna, content_type="unknown_type")
 
         result = analyzer.select_subreddits(dna)
         assert isinstance(result, list)
 
-    def test_no_matching_subreddits(self, tmp_path):
+    def test_no_matching_subreddits(self, tmp_path, tool_dna):
         """Test behavior when no subreddits match."""
         # Create minimal config with no matching content types
         config_path = tmp_path / "subreddit_data.yaml"
@@ -399,20 +326,9 @@ class TestEdgeCases:
             "subreddits": {}
         }
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
         analyzer = SubredditAnalyzer(tmp_path)
 
-        dna = ContentDNA(
-            value_proposition="Tool",
-            technical_details=[],
-            problem_solved="",
-            target_audience="developers",
-            key_metrics=[],
-            unique_aspects=[],
-            limitations=[],
-            content_type="tool"
-        )
-
-        result = analyzer.select_subreddits(dna)
+        result = analyzer.select_subreddits(tool_dna)
         assert result == []